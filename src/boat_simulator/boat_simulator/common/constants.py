@@ -36,7 +36,7 @@ class PhysicsEnginePublisherTopics:
     WIND_SENSORS: str = "mock_wind_sensors"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoatProperties:
     # A lookup table that maps angles of attack (in degrees) to their corresponding lift
     # coefficients.
@@ -67,6 +67,13 @@ class BoatProperties:
     # The inertia of the boat (in kilograms-meters squared).
     inertia: NDArray
 
+    def __post_init__(self):
+        # Store the inertia once as a read-only array of 64-bit floats so that it cannot be
+        # modified in place and does not need to be converted by the physics engine
+        inertia = np.array(self.inertia, dtype=np.float64)
+        inertia.setflags(write=False)
+        object.__setattr__(self, "inertia", inertia)
+
 
 # Directly accessible constants
 
@@ -1,6 +1,7 @@
 """Random vector generator classes."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -13,20 +14,26 @@ class VectorGenerator(ABC):
     generators.
 
     Attributes:
-        seed (int): The seed used to seed the random number generator.
-        rng (np.random.Generator): The seeded random number generator.
+        seed (Optional[int]): The seed used to seed the random number generator, or None if it
+            is seeded with fresh entropy.
+        rng (np.random.Generator): The random number generator, either seeded with `seed` or
+            provided by the caller.
     """
 
-    def __init__(self, seed: int = 0):
+    def __init__(self, seed: Optional[int] = 0, rng: Optional[np.random.Generator] = None):
         """Initializes an instance of `VectorGenerator`. Note that this class cannot be
         instantiated directly since it is abstract.
 
         Args:
-            seed (int, optional): The seed used to seed the random number generator
-                (if used at all). Defaults to 0.
+            seed (Optional[int], optional): The seed used to seed the random number generator
+                (if used at all), or None to seed it with fresh entropy. Ignored if `rng` is
+                given. Defaults to 0.
+            rng (Optional[np.random.Generator], optional): A random number generator to draw
+                from instead of creating one, allowing several generators to share a single
+                stream. Defaults to None.
         """
         self.__seed = seed
-        self.__rng = np.random.default_rng(seed=seed)
+        self.__rng = np.random.default_rng(seed=seed) if rng is None else rng
 
     def next(self) -> ScalarOrArray:
         """Generates the next value in the sequence. This function acts as an alias to the
@@ -47,7 +54,7 @@ class VectorGenerator(ABC):
         pass
 
     @property
-    def seed(self) -> int:
+    def seed(self) -> Optional[int]:
         return self.__seed
 
     @property
@@ -67,21 +74,31 @@ class GaussianGenerator(VectorGenerator):
     Extends: VectorGenerator
     """
 
-    def __init__(self, mean: Scalar, stdev: Scalar, seed: int = 0):
+    def __init__(
+        self,
+        mean: Scalar,
+        stdev: Scalar,
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
+    ):
         """Initializes an instance of GaussianGenerator.
 
         Args:
-            mean (Scalar): _description_
-            stdev (Scalar): _description_
-            seed (int, optional): _description_. Defaults to 0.
+            mean (Scalar): The mean of the gaussian distribution.
+            stdev (Scalar): The standard deviation of the gaussian distribution.
+            seed (Optional[int], optional): The seed that seeds the random number generator.
+                Defaults to None, which seeds it with fresh entropy so that generators created
+                without a seed produce independent sequences.
+            rng (Optional[np.random.Generator], optional): A random number generator to draw
+                from instead of seeding a new one. Defaults to None.
         """
-        super().__init__(seed=seed)
+        super().__init__(seed=seed, rng=rng)
         self.__mean = mean
         self.__stdev = stdev
         self.next()
 
     def _next(self) -> Scalar:
-        self.__value = np.random.normal(self.mean, self.stdev)
+        self.__value = self.rng.normal(self.mean, self.stdev)
         return self.__value
 
     @property
@@ -109,7 +126,13 @@ class MVGaussianGenerator(VectorGenerator):
     Extends: VectorGenerator
     """
 
-    def __init__(self, mean: NDArray, cov: NDArray, seed: int = 0):
+    def __init__(
+        self,
+        mean: NDArray,
+        cov: NDArray,
+        seed: int = 0,
+        rng: Optional[np.random.Generator] = None,
+    ):
         """Initializes an instance of MVGaussianGenerator.
 
         Args:
@@ -117,16 +140,39 @@ class MVGaussianGenerator(VectorGenerator):
             cov (NDArray): The covariance matrix of the gaussian distribution. Should be positive
                 semi-definite and have a shape of (N,N).
             seed (int, optional): The seed that seeds the random number generator. Defaults to 0.
+            rng (Optional[np.random.Generator], optional): A random number generator to draw
+                from instead of seeding a new one. Defaults to None.
         """
-        super().__init__(seed=seed)
+        super().__init__(seed=seed, rng=rng)
         self.__mean = mean
         self.__cov = cov
+        self.__cov_factor = MVGaussianGenerator.__factorize(cov)
         self.next()
 
     def _next(self) -> NDArray:
-        self.__value = self.rng.multivariate_normal(self.mean, self.cov)
+        self.__value = self.__mean + self.__cov_factor @ self.rng.standard_normal(self.__mean.size)
         return self.__value
 
+    @staticmethod
+    def __factorize(cov: NDArray) -> NDArray:
+        """Computes a matrix `L` such that `L @ L.T` equals the covariance matrix, so that samples
+        can be drawn as `mean + L @ z` with `z` standard normal without refactoring `cov` on
+        every draw.
+
+        Args:
+            cov (NDArray): The covariance matrix of the gaussian distribution. Shape (N,N).
+
+        Returns:
+            NDArray: The factor `L`. Shape (N,N).
+        """
+        try:
+            return np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            # Cholesky requires a positive definite matrix, so fall back to the eigendecomposition
+            # for covariances that are only positive semi-definite (e.g. zero noise)
+            eigenvalues, eigenvectors = np.linalg.eigh(cov)
+            return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
     @property
     def mean(self) -> NDArray:
         return self.__mean
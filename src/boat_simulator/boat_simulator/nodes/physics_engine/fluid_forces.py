@@ -1,9 +1,8 @@
 """This module provides functionality for computing the lift and drag forces acting on a medium."""
 
-from typing import Tuple
+import math
+from typing import Tuple, Union
 
-import matplotlib.patches as patches
-import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import NDArray
 
@@ -89,7 +88,7 @@ class MediumForceComputation:
 
         attack_angle = self.calculate_attack_angle(apparent_velocity, orientation)
         lift_coefficient, drag_coefficient = self.interpolate(attack_angle)
-        velocity_magnitude = np.linalg.norm(apparent_velocity)
+        velocity_magnitude = math.hypot(*apparent_velocity)
 
         # Calculate the lift and drag forces
 
@@ -146,6 +145,65 @@ class MediumForceComputation:
 
         return lift_force, drag_force
 
+    def compute_batch(
+        self, apparent_velocities: NDArray, orientations: Union[Scalar, NDArray]
+    ) -> Tuple[NDArray, NDArray]:
+        """Computes the lift and drag forces experienced by a medium for a batch of apparent
+        velocities at once. Each row gives the same result as `compute`, except that rows with a
+        zero apparent velocity produce zero forces, and attack angles that lie exactly on an axis
+        always produce zero lift.
+
+        Args:
+            apparent_velocities (NDArray): The apparent (relative) velocities between the fluid
+                and the medium, expressed in meters per second (m/s). Shape (N, 2).
+            orientations (Union[Scalar, NDArray]): The orientation angles of the medium in
+                degrees, either one angle for the whole batch or one per row with shape (N,).
+
+        Returns:
+            Tuple[NDArray, NDArray]: A tuple containing the lift forces and drag forces
+                experienced by the medium, both expressed in newtons (N) with shape (N, 2).
+        """
+        apparent_velocities = np.asarray(apparent_velocities, dtype=np.float64)
+        velocity_magnitudes = np.hypot(apparent_velocities[:, 0], apparent_velocities[:, 1])
+
+        attack_angles = (
+            np.rad2deg(np.arctan2(apparent_velocities[:, 1], apparent_velocities[:, 0]))
+            - orientations
+        )
+        attack_angles = ((attack_angles + 180) % 360) - 180
+        lift_coefficients, drag_coefficients = self.interpolate(attack_angles)
+
+        dynamic_forces = 0.5 * self.__fluid_density * self.__areas * (velocity_magnitudes**2)
+        drag_force_unit_vectors = np.divide(
+            apparent_velocities,
+            velocity_magnitudes[:, np.newaxis],
+            out=np.zeros_like(apparent_velocities),
+            where=velocity_magnitudes[:, np.newaxis] > 0,
+        )
+
+        # Lift is perpendicular to drag, rotated counter clockwise when the attack angle is in the
+        # first or third quadrant and clockwise when in the second or fourth, as in `compute`.
+        # Quadrants are decided with exact comparisons so that attack angles on an axis give no
+        # lift.
+        is_in_first_or_third_quadrant = ((attack_angles > 0) & (attack_angles < 90)) | (
+            (attack_angles > -180) & (attack_angles < -90)
+        )
+        is_in_second_or_fourth_quadrant = ((attack_angles > 90) & (attack_angles < 180)) | (
+            (attack_angles > -90) & (attack_angles < 0)
+        )
+        rotation_signs = np.where(
+            is_in_first_or_third_quadrant,
+            1.0,
+            np.where(is_in_second_or_fourth_quadrant, -1.0, 0.0),
+        )
+        lift_force_directions = rotation_signs[:, np.newaxis] * np.column_stack(
+            (-drag_force_unit_vectors[:, 1], drag_force_unit_vectors[:, 0])
+        )
+
+        lift_forces = (dynamic_forces * lift_coefficients)[:, np.newaxis] * lift_force_directions
+        drag_forces = (dynamic_forces * drag_coefficients)[:, np.newaxis] * drag_force_unit_vectors
+        return lift_forces, drag_forces
+
     def __calculate_fluid_force_magnitude(
         self, coefficient: Scalar, velocity_magnitude: Scalar
     ) -> Scalar:
@@ -258,6 +316,11 @@ class MediumForceComputation:
         self, apparent_velocity, lift_force, drag_force, position=[0, 0], orientation=0
     ):
         """Visualizes the sailboat, apparent velocity, lift force, and drag force."""
+        # Imported here since plotting is only used for debugging, and importing matplotlib
+        # would otherwise add hundreds of milliseconds to every import of this module
+        import matplotlib.patches as patches
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
         attack_angle = self.calculate_attack_angle(apparent_velocity, orientation)
         # Normalize forces for visualization
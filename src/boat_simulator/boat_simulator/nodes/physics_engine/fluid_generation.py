@@ -1,5 +1,7 @@
 """This module provides a generator for fluid vectors used within the physics engine."""
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
@@ -49,7 +51,7 @@ class FluidGenerator:
             Scalar: The speed of the fluid, expressed in meters per second (m/s) and within the
                 range of 0 to positive infinity.
         """
-        return np.linalg.norm(self.__velocity)
+        return math.hypot(*self.__velocity)
 
     @property
     def direction(self) -> Scalar:
@@ -40,8 +40,9 @@ class BoatKinematics:
         self.__timestep = timestep
         self.__boat_mass = mass
         assert inertia.shape == (3, 3)
-        self.__inertia = inertia
-        self.__inertia_inverse = np.linalg.inv(inertia)
+        # Stored as 64-bit floats so that the per-step torque products do not need to upcast
+        self.__inertia = np.ascontiguousarray(inertia, dtype=np.float64)
+        self.__inertia_inverse = np.linalg.inv(self.__inertia)
         self.__relative_data = KinematicsData()
         self.__global_data = KinematicsData()
 
@@ -69,7 +70,7 @@ class BoatKinematics:
         glo_net_force = rel_net_force * np.array([np.cos(yaw_radians), np.sin(yaw_radians), 0])
         self.__update_linear_global_data(glo_net_force)
 
-        return (self.relative_data, self.global_data)
+        return (self.__relative_data, self.__global_data)
 
     def __update_ang_data(self, net_torque: NDArray) -> Scalar:
         """Update the angular kinematics data.
@@ -82,33 +83,38 @@ class BoatKinematics:
             Scalar: The next angular position along the yaw axis in the global reference frame,
                 expressed in radians (rad).
         """
+        # Bind once since the data and timestep are read several times below
+        relative_data = self.__relative_data
+        global_data = self.__global_data
+        timestep = self.__timestep
+
         next_ang_acceleration = KinematicsFormulas.next_ang_acceleration(
-            net_torque, self.inertia_inverse
+            net_torque, self.__inertia_inverse
         )
 
         next_ang_velocity = KinematicsFormulas.next_velocity(
-            self.global_data.angular_velocity,
-            self.global_data.angular_acceleration,
-            self.timestep,
+            global_data.angular_velocity,
+            global_data.angular_acceleration,
+            timestep,
         )
 
         next_ang_position = utils.bound_to_180(
             KinematicsFormulas.next_position(
-                self.global_data.angular_position,
-                self.global_data.angular_velocity,
-                self.global_data.angular_acceleration,
-                self.timestep,
+                global_data.angular_position,
+                global_data.angular_velocity,
+                global_data.angular_acceleration,
+                timestep,
             ),
             isDegrees=False,
         )
 
-        self.__relative_data.angular_acceleration = next_ang_acceleration
-        self.__relative_data.angular_velocity = next_ang_velocity
-        self.__relative_data.angular_position[:] = 0  # relative angular position is unused
+        relative_data.angular_acceleration = next_ang_acceleration
+        relative_data.angular_velocity = next_ang_velocity
+        relative_data.angular_position[:] = 0  # relative angular position is unused
 
-        self.__global_data.angular_acceleration = next_ang_acceleration
-        self.__global_data.angular_velocity = next_ang_velocity
-        self.__global_data.angular_position = next_ang_position
+        global_data.angular_acceleration = next_ang_acceleration
+        global_data.angular_velocity = next_ang_velocity
+        global_data.angular_position = next_ang_position
 
         yaw_radians = next_ang_position[constants.ORIENTATION_INDICES.YAW.value]
 
@@ -121,18 +127,20 @@ class BoatKinematics:
             net_force (NDArray): The net force acting on the boat in the relative reference
                 frame, expressed in newtons (N).
         """
+        relative_data = self.__relative_data
+
         next_relative_acceleration = KinematicsFormulas.next_lin_acceleration(
-            self.boat_mass, net_force
+            self.__boat_mass, net_force
         )
         next_relative_velocity = KinematicsFormulas.next_velocity(
-            self.relative_data.linear_velocity,
-            self.relative_data.linear_acceleration,
-            self.timestep,
+            relative_data.linear_velocity,
+            relative_data.linear_acceleration,
+            self.__timestep,
         )
 
-        self.__relative_data.linear_acceleration = next_relative_acceleration
-        self.__relative_data.linear_velocity = next_relative_velocity
-        self.__relative_data.linear_position[:] = 0  # linear position is unused
+        relative_data.linear_acceleration = next_relative_acceleration
+        relative_data.linear_velocity = next_relative_velocity
+        relative_data.linear_position[:] = 0  # linear position is unused
 
     def __update_linear_global_data(self, net_force: NDArray) -> None:
         """Updates the linear kinematic data in the global reference frame.
@@ -141,22 +149,25 @@ class BoatKinematics:
             net_force (NDArray): The net force acting on the boat in the global reference frame,
                 expressed in newtons (N).
         """
+        global_data = self.__global_data
+        timestep = self.__timestep
+
         next_global_acceleration = KinematicsFormulas.next_lin_acceleration(
-            self.boat_mass, net_force
+            self.__boat_mass, net_force
         )
         next_global_velocity = KinematicsFormulas.next_velocity(
-            self.global_data.linear_velocity, self.global_data.linear_acceleration, self.timestep
+            global_data.linear_velocity, global_data.linear_acceleration, timestep
         )
         next_global_position = KinematicsFormulas.next_position(
-            self.global_data.linear_position,
-            self.global_data.linear_velocity,
-            self.global_data.linear_acceleration,
-            self.timestep,
+            global_data.linear_position,
+            global_data.linear_velocity,
+            global_data.linear_acceleration,
+            timestep,
         )
 
-        self.__global_data.linear_acceleration = next_global_acceleration
-        self.__global_data.linear_velocity = next_global_velocity
-        self.__global_data.linear_position = next_global_position
+        global_data.linear_acceleration = next_global_acceleration
+        global_data.linear_velocity = next_global_velocity
+        global_data.linear_position = next_global_position
 
     @property
     def relative_data(self) -> KinematicsData:
@@ -1,6 +1,8 @@
 """This module represents the state of the boat at a given step in time."""
 
-from typing import Tuple
+from dataclasses import dataclass
+from math import hypot
+from typing import Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,6 +13,68 @@ from boat_simulator.nodes.physics_engine.kinematics_computation import BoatKinem
 from boat_simulator.nodes.physics_engine.kinematics_data import KinematicsData
 
 
+@dataclass(slots=True)
+class BoatSnapshot:
+    """Bundles the kinematic quantities of the boat most commonly read after a step, so that they
+    can be read without going through the kinematics computation each time.
+
+    Attributes:
+        `global_position` (NDArray): Linear position of the boat in the global reference frame,
+            expressed in meters (m).
+        `global_velocity` (NDArray): Linear velocity of the boat in the global reference frame,
+            expressed in meters per second (m/s).
+        `global_acceleration` (NDArray): Linear acceleration of the boat in the global reference
+            frame, expressed in meters per second squared (m/s^2).
+        `angular_position` (NDArray): Angular position of the boat in the relative reference
+            frame, expressed in radians (rad).
+        `angular_velocity` (NDArray): Angular velocity of the boat in the relative reference
+            frame, expressed in radians per second (rad/s).
+        `angular_acceleration` (NDArray): Angular acceleration of the boat in the relative
+            reference frame, expressed in radians per second squared (rad/s^2).
+        `speed` (Scalar): Speed of the boat in the relative reference frame, expressed in meters
+            per second (m/s).
+    """
+
+    global_position: NDArray
+    global_velocity: NDArray
+    global_acceleration: NDArray
+    angular_position: NDArray
+    angular_velocity: NDArray
+    angular_acceleration: NDArray
+    speed: Scalar
+
+
+@dataclass(slots=True)
+class BoatTrajectory:
+    """Records the kinematic quantities of the boat after each step of a sequence of steps, with
+    one row per step.
+
+    Attributes:
+        `global_position` (NDArray): Linear positions of the boat in the global reference frame,
+            expressed in meters (m). Shape (N, 3).
+        `global_velocity` (NDArray): Linear velocities of the boat in the global reference frame,
+            expressed in meters per second (m/s). Shape (N, 3).
+        `global_acceleration` (NDArray): Linear accelerations of the boat in the global reference
+            frame, expressed in meters per second squared (m/s^2). Shape (N, 3).
+        `angular_position` (NDArray): Angular positions of the boat in the relative reference
+            frame, expressed in radians (rad). Shape (N, 3).
+        `angular_velocity` (NDArray): Angular velocities of the boat in the relative reference
+            frame, expressed in radians per second (rad/s). Shape (N, 3).
+        `angular_acceleration` (NDArray): Angular accelerations of the boat in the relative
+            reference frame, expressed in radians per second squared (rad/s^2). Shape (N, 3).
+        `speed` (NDArray): Speeds of the boat in the relative reference frame, expressed in
+            meters per second (m/s). Shape (N,).
+    """
+
+    global_position: NDArray
+    global_velocity: NDArray
+    global_acceleration: NDArray
+    angular_position: NDArray
+    angular_velocity: NDArray
+    angular_acceleration: NDArray
+    speed: NDArray
+
+
 class BoatState:
     """Represents the state of the boat at a specific point in time, including kinematic data
     in both relative and global reference frames.
@@ -19,8 +83,17 @@ class BoatState:
         `kinematics_computation` (BoatKinematics): The kinematic data for the boat in both
             the relative and global reference frames, used for computing future kinematic data,
             expressed in SI units.
+        `snapshot` (BoatSnapshot): The commonly read kinematic quantities of the boat as of the
+            latest step, expressed in SI units. Built on first access after each step.
     """
 
+    # Attributes are accessed on every step, so slots are used for faster lookups. Private names
+    # are mangled by Python the same way as the attributes assigned in the methods.
+    __slots__ = (
+        "__kinematics_computation",
+        "__snapshot",
+    )
+
     def __init__(self, timestep: Scalar):
         """Initializes an instance of `BoatState`.
 
@@ -30,6 +103,7 @@ class BoatState:
         self.__kinematics_computation = BoatKinematics(
             timestep, BOAT_PROPERTIES.mass, BOAT_PROPERTIES.inertia
         )
+        self.__snapshot: Optional[BoatSnapshot] = None
 
     def step(
         self,
@@ -62,8 +136,80 @@ class BoatState:
         rel_net_force, net_torque = self.__compute_net_force_and_torque(
             rel_wind_vel, rel_water_vel, rudder_angle_deg, trim_tab_angle
         )
+        self.__snapshot = None  # Outdated, rebuilt when next read
         return self.__kinematics_computation.step(rel_net_force, net_torque)
 
+    def step_batch(
+        self,
+        glo_wind_vels: NDArray,
+        glo_water_vels: NDArray,
+        rudder_angles_deg: NDArray,
+        trim_tab_angles: NDArray,
+    ) -> BoatTrajectory:
+        """Steps the boat through a time series of wind, current, and actuator inputs, one
+        timestep per row, and records the boat's kinematic quantities after every step. This is
+        only a convenience wrapper that calls `step` once per row, so it is no faster than
+        calling `step` in a loop.
+
+        Args:
+            glo_wind_vels (NDArray): The velocities of the true wind in the global reference frame,
+                expressed in meters per second (m/s). Shape (N, 2).
+            glo_water_vels (NDArray): The velocities of the current in the global reference frame,
+                expressed in meters per second (m/s). Shape (N, 2).
+            rudder_angles_deg (NDArray): The rudder angles with respect to the boat in degrees.
+                Shape (N,).
+            trim_tab_angles (NDArray): The trim tab angles with respect to the wingsail in
+                degrees. Shape (N,).
+
+        Returns:
+            BoatTrajectory: The kinematic quantities of the boat after each step, expressed in SI
+                units.
+        """
+        num_steps = len(glo_wind_vels)
+        assert glo_water_vels.shape == (num_steps, 2) and glo_wind_vels.shape == (num_steps, 2)
+        assert len(rudder_angles_deg) == num_steps and len(trim_tab_angles) == num_steps
+
+        trajectory = BoatTrajectory(
+            global_position=np.empty((num_steps, 3)),
+            global_velocity=np.empty((num_steps, 3)),
+            global_acceleration=np.empty((num_steps, 3)),
+            angular_position=np.empty((num_steps, 3)),
+            angular_velocity=np.empty((num_steps, 3)),
+            angular_acceleration=np.empty((num_steps, 3)),
+            speed=np.empty(num_steps),
+        )
+        for i in range(num_steps):
+            rel_data, glo_data = self.step(
+                glo_wind_vels[i], glo_water_vels[i], rudder_angles_deg[i], trim_tab_angles[i]
+            )
+            trajectory.global_position[i] = glo_data.linear_position
+            trajectory.global_velocity[i] = glo_data.linear_velocity
+            trajectory.global_acceleration[i] = glo_data.linear_acceleration
+            trajectory.angular_position[i] = rel_data.angular_position
+            trajectory.angular_velocity[i] = rel_data.angular_velocity
+            trajectory.angular_acceleration[i] = rel_data.angular_acceleration
+            trajectory.speed[i] = hypot(*rel_data.linear_velocity)
+        return trajectory
+
+    def __take_snapshot(self) -> BoatSnapshot:
+        """Collects the commonly read kinematic quantities of the boat from its current kinematic
+        data.
+
+        Returns:
+            BoatSnapshot: The kinematic quantities of the boat, expressed in SI units.
+        """
+        relative_data = self.__kinematics_computation.relative_data
+        global_data = self.__kinematics_computation.global_data
+        return BoatSnapshot(
+            global_position=global_data.linear_position,
+            global_velocity=global_data.linear_velocity,
+            global_acceleration=global_data.linear_acceleration,
+            angular_position=relative_data.angular_position,
+            angular_velocity=relative_data.angular_velocity,
+            angular_acceleration=relative_data.angular_acceleration,
+            speed=hypot(*relative_data.linear_velocity),
+        )
+
     def __compute_net_force_and_torque(
         self,
         rel_wind_vel: NDArray,
@@ -121,7 +267,7 @@ class BoatState:
 
     @property
     def angular_acceleration(self) -> NDArray:
-        return self.__kinematics_computation.relative_data.angular_position
+        return self.__kinematics_computation.relative_data.angular_acceleration
 
     @property
     def inertia(self) -> NDArray:
@@ -141,7 +287,13 @@ class BoatState:
 
     @property
     def speed(self) -> Scalar:
-        return np.linalg.norm(x=self.relative_velocity, ord=2)
+        return hypot(*self.relative_velocity)
+
+    @property
+    def snapshot(self) -> BoatSnapshot:
+        if self.__snapshot is None:
+            self.__snapshot = self.__take_snapshot()
+        return self.__snapshot
 
     @property
     def true_bearing(self) -> Scalar:
@@ -43,6 +43,29 @@ class TestGaussianGenerator:
         assert np.allclose(sample_std, stdev, atol=threshold)
         assert np.allclose(sample_mean, mean, atol=threshold)
 
+    def test_gaussian_generator_seed(self):
+        """This test checks that generators with the same seed produce the same sequence, and
+        that generators sharing a random number generator draw from a single stream
+        """
+        first_generator = GaussianGenerator(mean=1.0, stdev=2.0, seed=7)
+        second_generator = GaussianGenerator(mean=1.0, stdev=2.0, seed=7)
+        assert [first_generator.next() for _ in range(10)] == [
+            second_generator.next() for _ in range(10)
+        ]
+
+        rng = np.random.default_rng(seed=7)
+        shared_generators = [GaussianGenerator(mean=1.0, stdev=2.0, rng=rng) for _ in range(2)]
+        assert shared_generators[0].rng is shared_generators[1].rng
+        assert shared_generators[0].value != shared_generators[1].value
+
+    def test_gaussian_generator_default_seed(self):
+        """This test checks that generators created without a seed produce independent sequences"""
+        first_generator = GaussianGenerator(mean=0.0, stdev=1.0)
+        second_generator = GaussianGenerator(mean=0.0, stdev=5.0)
+        first_samples = np.array([first_generator.next() for _ in range(10)])
+        second_samples = np.array([second_generator.next() for _ in range(10)])
+        assert not np.allclose(second_samples / 5.0, first_samples)
+
 
 class TestMVGaussianGenerator:
     @pytest.mark.parametrize(
@@ -77,6 +100,33 @@ class TestMVGaussianGenerator:
         assert np.allclose(sample_cov, cov, atol=0.2)
         assert np.isclose(sample_mean, mean, 0.1).all()
 
+    @pytest.mark.parametrize(
+        "mean, cov",
+        [
+            (np.array([1, 2]), np.zeros((2, 2))),
+            (np.array([1, 2]), np.diag([4, 0])),
+            (np.array([1, 2, 3]), np.ones((3, 3))),
+        ],
+    )
+    def test_multivariate_vector_generation_singular_cov(self, mean, cov):
+        """This test checks that covariance matrices which are positive semi-definite but not
+        positive definite are supported, and that the directions with no variance stay fixed
+
+        Args:
+            mean (array): Input array of size n
+            cov (array): Singular covariance matrix of shape (n, n)
+        """
+        NUM_SAMPLES = 10000
+        generator = MVGaussianGenerator(mean=mean, cov=cov)
+        samples = np.array([generator.next() for _ in range(NUM_SAMPLES)])
+        sample_cov = np.cov(samples, rowvar=False)
+
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        null_directions = eigenvectors[:, np.isclose(eigenvalues, 0)]
+
+        assert np.allclose(sample_cov, cov, atol=0.2)
+        assert np.allclose(samples @ null_directions, mean @ null_directions)
+
 
 class TestConstantGenerator:
     @pytest.mark.parametrize(
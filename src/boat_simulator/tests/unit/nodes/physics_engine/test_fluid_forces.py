@@ -100,3 +100,53 @@ def test_compute_forces(
     assert np.isclose(
         np.linalg.norm(drag_force), expected_drag, rtol=0.05
     ), f"Expected {expected_drag}, got {np.linalg.norm(drag_force)}"
+
+
+def test_compute_batch(medium_force_setup):
+    attack_angles = np.deg2rad([0, 5, 10, 15, 20, -7, 95, 170, -120, 45])
+    apparent_velocities = 44 * np.column_stack((np.cos(attack_angles), np.sin(attack_angles)))
+    orientations = np.array([0, 0, 0, 0, 0, 3, -10, 20, 160, -40])
+
+    lift_forces, drag_forces = medium_force_setup.compute_batch(apparent_velocities, orientations)
+    assert lift_forces.shape == drag_forces.shape == apparent_velocities.shape
+    for i in range(len(apparent_velocities)):
+        lift_force, drag_force = medium_force_setup.compute(
+            apparent_velocities[i], orientations[i]
+        )
+        assert np.allclose(lift_forces[i], lift_force)
+        assert np.allclose(drag_forces[i], drag_force)
+
+
+@pytest.mark.parametrize(
+    "apparent_velocity, orientation",
+    [
+        (np.array([5.0, 0.0]), 0),
+        (np.array([0.0, 5.0]), 0),
+        (np.array([-5.0, 0.0]), 0),
+        (np.array([0.0, -5.0]), 0),
+    ],
+)
+def test_compute_batch_axis_angles(medium_force_setup, apparent_velocity, orientation):
+    lift_forces, drag_forces = medium_force_setup.compute_batch(
+        apparent_velocity[np.newaxis, :], orientation
+    )
+    lift_force, drag_force = medium_force_setup.compute(apparent_velocity, orientation)
+    assert np.all(lift_forces[0] == 0)
+    assert np.allclose(lift_forces[0], lift_force)
+    assert np.allclose(drag_forces[0], drag_force)
+
+
+@pytest.mark.parametrize("orientation", [30, -60, 135, -150])
+@pytest.mark.parametrize("attack_angle", [0, 90, -90, -180])
+def test_compute_batch_axis_angles_rotated(medium_force_setup, attack_angle, orientation):
+    angle = np.deg2rad(attack_angle + orientation)
+    apparent_velocity = 5 * np.array([[np.cos(angle), np.sin(angle)]])
+    lift_forces, _ = medium_force_setup.compute_batch(apparent_velocity, orientation)
+    assert np.all(lift_forces == 0)
+
+
+def test_compute_batch_zero_velocity(medium_force_setup):
+    lift_forces, drag_forces = medium_force_setup.compute_batch(np.array([[0, 0], [3, 4]]), 0)
+    assert np.all(lift_forces[0] == 0)
+    assert np.all(drag_forces[0] == 0)
+    assert np.all(drag_forces[1] != 0)
@@ -6,6 +6,10 @@ import pytest
 from boat_simulator.common.generators import ConstantGenerator, MVGaussianGenerator
 from boat_simulator.nodes.physics_engine.fluid_generation import FluidGenerator
 
+# Fluid velocities shared by the speed and direction tests, one vector per row
+VECTORS = np.array([[1, 0], [0, 1], [-1, 0], [0, -1], [1, 1], [-1, -1]])
+EXPECTED_DIRECTIONS = np.array([0, 90, -180, -90, 45, -135])
+
 
 class TestFluidGenerator:
     @pytest.mark.parametrize(
@@ -39,37 +43,20 @@ class TestFluidGenerator:
         next_fluid_vector = fluid_generator.next()
         assert np.all(next_fluid_vector != first_fluid_vector)
 
-    @pytest.mark.parametrize(
-        "vector",
-        [
-            (np.array([1, 0])),
-            (np.array([0, 1])),
-            (np.array([-1, 0])),
-            (np.array([0, -1])),
-            (np.array([1, 1])),
-            (np.array([-1, -1])),
-        ],
-    )
-    def test_speed(self, vector):
-        vector_generator = ConstantGenerator(constant=vector)
-        fluid_generator = FluidGenerator(generator=vector_generator)
-        generated_fluid_vector = fluid_generator.next()
-        assert np.all(vector == generated_fluid_vector)
-        assert np.linalg.norm(vector) == fluid_generator.speed
+    def test_speed(self):
+        fluid_generators = [
+            FluidGenerator(generator=ConstantGenerator(constant=vector)) for vector in VECTORS
+        ]
+        generated_fluid_vectors = np.array([generator.next() for generator in fluid_generators])
+        speeds = np.array([generator.speed for generator in fluid_generators])
+        np.testing.assert_array_equal(generated_fluid_vectors, VECTORS)
+        np.testing.assert_array_equal(speeds, np.linalg.norm(VECTORS, axis=1))
 
-    @pytest.mark.parametrize(
-        "vector, expected_direction",
-        [
-            (np.array([1, 0]), 0),
-            (np.array([0, 1]), 90),
-            (np.array([-1, 0]), -180),
-            (np.array([0, -1]), -90),
-            (np.array([1, 1]), 45),
-            (np.array([-1, -1]), -135),
-        ],
-    )
-    def test_direction(self, vector, expected_direction):
-        vector_generator = ConstantGenerator(constant=vector)
-        fluid_generator = FluidGenerator(generator=vector_generator)
-        calculated_direction = fluid_generator.direction
-        assert np.isclose(calculated_direction, expected_direction, atol=1e-7)
+    def test_direction(self):
+        directions = np.array(
+            [
+                FluidGenerator(generator=ConstantGenerator(constant=vector)).direction
+                for vector in VECTORS
+            ]
+        )
+        np.testing.assert_allclose(directions, EXPECTED_DIRECTIONS, rtol=0, atol=1e-7)
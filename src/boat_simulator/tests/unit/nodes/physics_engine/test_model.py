@@ -1,5 +1,117 @@
 """Tests classes and functions in boat_simulator/nodes/physics_engine/model.py"""
 
+import numpy as np
+import pytest
+
+from boat_simulator.nodes.physics_engine.model import BoatState, BoatTrajectory
+
+# Forces applied in place of the stubbed force model, so that the boat actually moves
+NET_FORCE = np.array([120.0, -45.0, 0.0])
+NET_TORQUE = np.array([0.0, 0.0, 30.0])
+
+
+@pytest.fixture
+def constant_forces(monkeypatch):
+    monkeypatch.setattr(
+        BoatState,
+        "_BoatState__compute_net_force_and_torque",
+        lambda self, *args: (NET_FORCE.copy(), NET_TORQUE.copy()),
+    )
+
 
 class TestBoatState:
-    pass
+    def test_step_no_wind_no_current(self):
+        boat_state = BoatState(timestep=0.5)
+        boat_state.step(np.zeros(2), np.zeros(2), 0, 0)
+        assert np.all(boat_state.relative_acceleration == 0)
+        assert np.all(boat_state.angular_acceleration == 0)
+
+    @pytest.mark.parametrize(
+        "glo_wind_vel, glo_water_vel, rudder_angle_deg, trim_tab_angle",
+        [
+            (np.array([5.0, 0.0]), np.zeros(2), 0, 0),
+            (np.array([5.0, 2.0]), np.array([-1.0, 0.5]), 10, -5),
+            (np.array([-3.0, 4.0]), np.array([0.5, 0.5]), -20, 7),
+        ],
+    )
+    def test_step(
+        self, constant_forces, glo_wind_vel, glo_water_vel, rudder_angle_deg, trim_tab_angle
+    ):
+        boat_state = BoatState(timestep=0.5)
+        rel_data, glo_data = boat_state.step(
+            glo_wind_vel, glo_water_vel, rudder_angle_deg, trim_tab_angle
+        )
+        assert rel_data.linear_acceleration.shape == (3,)
+        assert glo_data.angular_acceleration.shape == (3,)
+        assert np.allclose(rel_data.linear_acceleration, NET_FORCE / boat_state.boat_mass)
+        assert np.allclose(glo_data.angular_acceleration, boat_state.inertia_inverse @ NET_TORQUE)
+
+    def test_speed(self, constant_forces):
+        boat_state = BoatState(timestep=0.5)
+        speeds = []
+        for _ in range(3):
+            boat_state.step(np.array([5.0, 2.0]), np.array([-1.0, 0.5]), 10, -5)
+            speeds.append(boat_state.speed)
+            assert boat_state.speed == pytest.approx(np.linalg.norm(boat_state.relative_velocity))
+        # Velocities lag the accelerations by one step
+        assert speeds[2] > speeds[1] > speeds[0] == 0
+
+    def test_angular_acceleration(self, constant_forces):
+        boat_state = BoatState(timestep=0.5)
+        rel_data, _ = boat_state.step(np.array([5.0, 2.0]), np.array([-1.0, 0.5]), 10, -5)
+        assert np.all(boat_state.angular_acceleration == rel_data.angular_acceleration)
+        assert np.allclose(
+            boat_state.angular_acceleration, boat_state.inertia_inverse @ NET_TORQUE
+        )
+        assert not np.allclose(boat_state.angular_acceleration, boat_state.angular_position)
+
+    def test_snapshot(self):
+        boat_state = BoatState(timestep=0.5)
+        assert boat_state.snapshot.speed == 0
+        for _ in range(3):
+            boat_state.step(np.array([5.0, 2.0]), np.array([-1.0, 0.5]), 10, -5)
+        snapshot = boat_state.snapshot
+        assert np.all(snapshot.global_position == boat_state.global_position)
+        assert np.all(snapshot.global_velocity == boat_state.global_velocity)
+        assert np.all(snapshot.global_acceleration == boat_state.global_acceleration)
+        assert np.all(snapshot.angular_position == boat_state.angular_position)
+        assert np.all(snapshot.angular_velocity == boat_state.angular_velocity)
+        assert np.all(snapshot.angular_acceleration == boat_state.angular_acceleration)
+        assert snapshot.speed == boat_state.speed
+        assert boat_state.snapshot is snapshot
+
+    def test_step_batch(self, constant_forces):
+        num_steps = 5
+        rng = np.random.default_rng(seed=0)
+        glo_wind_vels = rng.normal(5.0, 2.0, size=(num_steps, 2))
+        glo_water_vels = rng.normal(0.0, 0.5, size=(num_steps, 2))
+        rudder_angles_deg = rng.uniform(-20, 20, size=num_steps)
+        trim_tab_angles = rng.uniform(-10, 10, size=num_steps)
+
+        batch_boat_state = BoatState(timestep=0.5)
+        trajectory = batch_boat_state.step_batch(
+            glo_wind_vels, glo_water_vels, rudder_angles_deg, trim_tab_angles
+        )
+        assert isinstance(trajectory, BoatTrajectory)
+        assert trajectory.global_position.shape == (num_steps, 3)
+        assert trajectory.speed.shape == (num_steps,)
+        assert np.all(np.diff(trajectory.speed[1:]) > 0)
+        assert np.all(np.diff(trajectory.global_position[2:, :2], axis=0) != 0)
+
+        boat_state = BoatState(timestep=0.5)
+        for i in range(num_steps):
+            boat_state.step(
+                glo_wind_vels[i], glo_water_vels[i], rudder_angles_deg[i], trim_tab_angles[i]
+            )
+            assert np.allclose(trajectory.global_position[i], boat_state.global_position)
+            assert np.allclose(trajectory.global_velocity[i], boat_state.global_velocity)
+            assert np.allclose(trajectory.global_acceleration[i], boat_state.global_acceleration)
+            assert np.allclose(trajectory.angular_position[i], boat_state.angular_position)
+            assert np.allclose(trajectory.angular_velocity[i], boat_state.angular_velocity)
+            assert np.allclose(trajectory.angular_acceleration[i], boat_state.angular_acceleration)
+            assert trajectory.speed[i] == pytest.approx(boat_state.speed)
+        assert np.allclose(batch_boat_state.global_position, boat_state.global_position)
+
+    def test_slots(self):
+        boat_state = BoatState(timestep=0.5)
+        assert not hasattr(boat_state, "__dict__")
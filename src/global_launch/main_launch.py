@@ -17,6 +17,10 @@ from launch.substitutions import LaunchConfiguration
 
 PRODUCTION_ROS_PACKAGES = ["controller", "local_pathfinding", "network_systems"]
 DEVELOPMENT_ROS_PACKAGES = ["controller", "boat_simulator", "local_pathfinding", "network_systems"]
+ROS_PACKAGES_BY_MODE = {
+    "production": PRODUCTION_ROS_PACKAGES,
+    "development": DEVELOPMENT_ROS_PACKAGES,
+}
 
 # Global launch arguments and constants.
 ROS_PACKAGES_DIR = os.path.join(
@@ -93,13 +97,12 @@ def get_running_ros_packages(mode: str) -> List[str]:
     Returns:
         List[str]: List of ROS package names to be launched.
     """
-    match mode:
-        case "production":
-            return PRODUCTION_ROS_PACKAGES
-        case "development":
-            return DEVELOPMENT_ROS_PACKAGES
-        case _:
-            raise ValueError("Invalid launch mode. Must be one of 'production', 'development'.")
+    try:
+        return ROS_PACKAGES_BY_MODE[mode]
+    except KeyError:
+        raise ValueError(
+            "Invalid launch mode. Must be one of 'production', 'development'."
+        ) from None
 
 
 def get_include_launch_descriptions(ros_package_list: List[str]) -> List[IncludeLaunchDescription]:
@@ -111,17 +114,14 @@ def get_include_launch_descriptions(ros_package_list: List[str]) -> List[Include
     Returns:
         List[IncludeLaunchDescriptions]: The launch descriptions.
     """
-    include_launch_descriptions = []
-    for pkg in ros_package_list:
-        pkg_main_launch = os.path.join(ROS_PACKAGES_DIR, pkg, "launch", "main_launch.py")
-
-        # Note: Normally, arguments would be passed by setting the `launch_arguments` input.
-        # However, since we load global arguments in package launch files already, this is not
-        # necessary. Only the launch description source is required.
-        launch_description = IncludeLaunchDescription(
+    # Note: Normally, arguments would be passed by setting the `launch_arguments` input.
+    # However, since we load global arguments in package launch files already, this is not
+    # necessary. Only the launch description source is required.
+    return [
+        IncludeLaunchDescription(
             launch_description_source=PythonLaunchDescriptionSource(
-                launch_file_path=pkg_main_launch
+                launch_file_path=os.path.join(ROS_PACKAGES_DIR, pkg, "launch", "main_launch.py")
             )
         )
-        include_launch_descriptions.append(launch_description)
-    return include_launch_descriptions
+        for pkg in ros_package_list
+    ]
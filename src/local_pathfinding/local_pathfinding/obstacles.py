@@ -1,12 +1,15 @@
 """Describes obstacles which the Sailbot must avoid: Boats and Land"""
 
 import math
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 import numpy as np
+import shapely
 from custom_interfaces.msg import HelperAISShip, HelperLatLon
+from numpy.typing import NDArray
 from shapely.affinity import affine_transform
 from shapely.geometry import Point, Polygon
+from shapely.prepared import PreparedGeometry, prep
 
 from local_pathfinding.coord_systems import XY, latlon_to_xy, meters_to_km
 
@@ -26,6 +29,10 @@ class Obstacle:
         sailbot_speed (float): Speed of the SailBot in kmph.
         collision_zone (Optional[Polygon]): Shapely polygon representing the
             obstacle's collision zone. Shape depends on the child class.
+        collision_zone_bounds (Optional[Tuple[float, float, float, float]]): Bounding box of the
+            collision zone as (min_x, min_y, max_x, max_y). Like the prepared copy of the collision
+            zone used by `is_valid`, it is cached by `update_collision_zone` and is only valid
+            when the collision zone is set through it.
     """
 
     def __init__(
@@ -37,13 +44,16 @@ class Obstacle:
         self.sailbot_speed = sailbot_speed
 
         # Defined later by the child class
-        self.collision_zone = None
+        self.collision_zone: Optional[Polygon] = None
+        self.collision_zone_bounds: Optional[Tuple[float, float, float, float]] = None
+        self._prepared_collision_zone: Optional[PreparedGeometry] = None
 
-    def is_valid(self, point: XY) -> bool:
+    def is_valid(self, point: Union[XY, Point]) -> bool:
         """Checks if a point is contained the obstacle's collision zone.
 
         Args:
-            point (HelperLatLon): Point representing the state point to be checked.
+            point (Union[XY, Point]): Point representing the state point to be checked. A shapely
+                Point can be passed to avoid creating one on every check.
 
         Returns:
             bool: True if the point is not within the obstacle's collision zone, false otherwise.
@@ -51,13 +61,62 @@ class Obstacle:
         Raises:
             ValueError: If the collision zone has not been initialized.
         """
-        if self.collision_zone is None:
-            raise ValueError("Collision zone has not been initialized")
+        _, collision_zone_bounds, prepared_collision_zone = self._get_collision_zone()
+
+        if isinstance(point, Point):
+            x, y = point.x, point.y
+        else:
+            x, y = point
+
+        # Points outside the bounding box cannot be in the collision zone, so skip the polygon test
+        min_x, min_y, max_x, max_y = collision_zone_bounds
+        if not (min_x < x < max_x and min_y < y < max_y):
+            return True
 
         # contains() requires a shapely Point object as an argument
-        point = Point(*point)
+        if not isinstance(point, Point):
+            point = Point(x, y)
+        return not prepared_collision_zone.contains(point)
+
+    def is_valid_batch(self, xs: NDArray, ys: NDArray) -> NDArray:
+        """Checks which of several points are contained in the obstacle's collision zone, in a
+        single call rather than one `is_valid` call per point.
+
+        Args:
+            xs (NDArray): x coordinates of the state points to be checked.
+            ys (NDArray): y coordinates of the state points to be checked. Same shape as `xs`.
 
-        return not self.collision_zone.contains(point)
+        Returns:
+            NDArray: Boolean array with the shape of `xs`, True where the point is not within the
+                obstacle's collision zone, false otherwise.
+
+        Raises:
+            ValueError: If the collision zone has not been initialized.
+        """
+        collision_zone, _, _ = self._get_collision_zone()
+        return ~shapely.contains_xy(collision_zone, xs, ys)
+
+    def _get_collision_zone(
+        self,
+    ) -> Tuple[Polygon, Tuple[float, float, float, float], PreparedGeometry]:
+        """Gets the collision zone along with its cached bounds and prepared geometry, so that
+        `is_valid` and `is_valid_batch` agree on whether the collision zone has been initialized.
+
+        Returns:
+            Tuple[Polygon, Tuple[float, float, float, float], PreparedGeometry]: The collision
+                zone, its bounding box, and its prepared geometry.
+
+        Raises:
+            ValueError: If the collision zone has not been set through `update_collision_zone`.
+        """
+        if (
+            self.collision_zone is None
+            or self.collision_zone_bounds is None
+            or self._prepared_collision_zone is None
+        ):
+            raise ValueError("Collision zone has not been initialized")
+
+        return self.collision_zone, self.collision_zone_bounds, self._prepared_collision_zone
 
     def update_collision_zone(self, collision_zone: Polygon, offset: XY, angle: float):
         """Updates the collision zone of the obstacle. Called by the child classes.
@@ -77,7 +136,12 @@ class Obstacle:
 
         collision_zone = affine_transform(collision_zone, transformation)
 
-        self.collision_zone = collision_zone.buffer(COLLISION_ZONE_SAFETY_BUFFER, join_style=2)
+        collision_zone = collision_zone.buffer(COLLISION_ZONE_SAFETY_BUFFER, join_style=2)
+
+        self.collision_zone = collision_zone
+        self.collision_zone_bounds = collision_zone.bounds
+        # Prepared geometries index the polygon's edges, making repeated point queries faster
+        self._prepared_collision_zone = prep(collision_zone)
 
     def update_sailbot_data(self, sailbot_position: HelperLatLon, sailbot_speed: float):
         """Updates the sailbot's position and speed.
@@ -154,7 +218,7 @@ class Boat(Obstacle):
         cog = ais_ship.cog.heading
 
         # Calculate distance the boat will travel before soonest possible collision with Sailbot
-        projected_distance = self.calculate_projected_distance()
+        projected_distance = self.calculate_projected_distance(position)
 
         # TODO This feels too arbitrary, maybe will incorporate ROT at a later time
         collision_zone_width = projected_distance * COLLISION_ZONE_STRETCH_FACTOR * width
@@ -171,7 +235,7 @@ class Boat(Obstacle):
 
         self.update_collision_zone(boat_collision_zone, position, -cog)
 
-    def calculate_projected_distance(self) -> float:
+    def calculate_projected_distance(self, position: Optional[XY] = None) -> float:
         """Calculates the distance the boat obstacle will travel before collision, if
         Sailbot moves directly towards the soonest possible collision point at its current speed.
         The system is modeled by two parametric lines extending from the positions of the boat
@@ -184,11 +248,17 @@ class Boat(Obstacle):
         An in-depth explanation for this function can be found here:
         https://ubcsailbot.atlassian.net/wiki/spaces/prjt22/pages/1881145358/Obstacle+Class+Planning
 
+        Args:
+            position (Optional[XY]): Position of the boat relative to the reference point, if it
+                has already been computed by the caller. Computed from the AIS ship's latitude and
+                longitude if not given.
+
         Returns:
             float: Distance the boat will travel before collision or the max projection distance
                    if a collision is not possible.
         """
-        position = latlon_to_xy(self.reference, self.ais_ship.lat_lon)
+        if position is None:
+            position = latlon_to_xy(self.reference, self.ais_ship.lat_lon)
 
         # vector components of the boat's speed over ground
         cog_rad = math.radians(self.ais_ship.cog.heading)
@@ -0,0 +1,27 @@
+import pytest
+from custom_interfaces.msg import GPS, AISShips, Path, WindSensor
+from rclpy.impl.rcutils_logger import RcutilsLogger
+
+import local_pathfinding.ompl_path as ompl_path
+from local_pathfinding.local_path import LocalPathState
+
+
+@pytest.fixture(scope="session")
+def default_ompl_path() -> ompl_path.OMPLPath:
+    """Solves a default OMPL path once per test session, rather than every time a test module
+    that needs one is imported.
+
+    Returns:
+        ompl_path.OMPLPath: Path planned from a default local path state.
+    """
+    return ompl_path.OMPLPath(
+        parent_logger=RcutilsLogger(),
+        max_runtime=1,
+        local_path_state=LocalPathState(
+            gps=GPS(),
+            ais_ships=AISShips(),
+            global_path=Path(),
+            filtered_wind_sensor=WindSensor(),
+            planner="rrtstar",
+        ),
+    )
@@ -13,6 +13,18 @@ from shapely.geometry import Point, Polygon
 from local_pathfinding.coord_systems import XY, latlon_to_xy, meters_to_km
 from local_pathfinding.obstacles import COLLISION_ZONE_SAFETY_BUFFER, Boat, Obstacle
 
+# Positions shared by the test cases below, created once at import
+REFERENCE_POINT = HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776)
+SAILBOT_POSITION = HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611)
+AIS_SHIP_POSITION = HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385)
+# Points on either side of the boat collision zones checked in the validity tests
+INSIDE_COLLISION_ZONE_POINT = HelperLatLon(
+    latitude=52.174842845359755, longitude=-137.10372451905042
+)
+OUTSIDE_COLLISION_ZONE_POINT = HelperLatLon(
+    latitude=49.30499213908291, longitude=-123.31330140816111
+)
+
 
 # Test calculate projected distance
 # Boat and Sailbot in same location
@@ -20,7 +32,7 @@ from local_pathfinding.obstacles import COLLISION_ZONE_SAFETY_BUFFER, Boat, Obst
     "reference_point,sailbot_position,ais_ship,sailbot_speed",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
+            REFERENCE_POINT,
             HelperLatLon(latitude=51.957, longitude=-136.262),
             HelperAISShip(
                 id=1,
@@ -53,11 +65,11 @@ def test_calculate_projected_distance(
     "reference_point,sailbot_position,ais_ship,sailbot_speed",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
             HelperAISShip(
                 id=1,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -89,7 +101,7 @@ def test_create_collision_zone(
     [
         (
             HelperLatLon(latitude=52.0, longitude=-136.0),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            SAILBOT_POSITION,
             HelperAISShip(
                 id=1,
                 lat_lon=HelperLatLon(latitude=52.0, longitude=-136.0),
@@ -113,9 +125,8 @@ def test_position_collision_zone(
 
     if boat1.collision_zone is not None:
         unbuffered = boat1.collision_zone.buffer(-COLLISION_ZONE_SAFETY_BUFFER, join_style=2)
-        x, y = np.array(unbuffered.exterior.coords.xy)
-        x = np.array(x)
-        y = np.array(y)
+        coords = np.asarray(unbuffered.exterior.coords)
+        x, y = coords[:, 0], coords[:, 1]
         assert (x[0] + meters_to_km(boat1.ais_ship.width.dimension) / 2) == pytest.approx(0)
         assert (y[0] + meters_to_km(boat1.ais_ship.length.dimension) / 2) == pytest.approx(0)
 
@@ -125,11 +136,11 @@ def test_position_collision_zone(
     "reference_point,sailbot_position,ais_ship_1,ais_ship_2,sailbot_speed",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
             HelperAISShip(
                 id=1,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -138,7 +149,7 @@ def test_position_collision_zone(
             ),
             HelperAISShip(
                 id=2,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -167,10 +178,10 @@ def test_create_collision_zone_id_mismatch(
     "reference_point,sailbot_position,ais_ship,sailbot_speed,invalid_point,valid_point",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
             HelperAISShip(
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=0.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -178,14 +189,8 @@ def test_create_collision_zone_id_mismatch(
                 rot=HelperROT(rot=0),
             ),
             15.0,
-            latlon_to_xy(
-                HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-                HelperLatLon(latitude=52.174842845359755, longitude=-137.10372451905042),
-            ),
-            latlon_to_xy(
-                HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-                HelperLatLon(latitude=49.30499213908291, longitude=-123.31330140816111),
-            ),
+            INSIDE_COLLISION_ZONE_POINT,
+            OUTSIDE_COLLISION_ZONE_POINT,
         )
     ],
 )
@@ -194,12 +199,12 @@ def test_is_valid(
     sailbot_position: HelperLatLon,
     ais_ship: HelperAISShip,
     sailbot_speed: float,
-    invalid_point: XY,
-    valid_point: XY,
+    invalid_point: HelperLatLon,
+    valid_point: HelperLatLon,
 ):
     boat1 = Boat(reference_point, sailbot_position, sailbot_speed, ais_ship)
-    assert not boat1.is_valid(invalid_point)
-    assert boat1.is_valid(valid_point)
+    assert not boat1.is_valid(latlon_to_xy(reference_point, invalid_point))
+    assert boat1.is_valid(latlon_to_xy(reference_point, valid_point))
 
 
 # Test is_valid raises error when collision zone has not been set
@@ -207,17 +212,11 @@ def test_is_valid(
     "reference_point,sailbot_position,sailbot_speed,invalid_point,valid_point",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
             15.0,
-            latlon_to_xy(
-                HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-                HelperLatLon(latitude=52.174842845359755, longitude=-137.10372451905042),
-            ),
-            latlon_to_xy(
-                HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-                HelperLatLon(latitude=49.30499213908291, longitude=-123.31330140816111),
-            ),
+            INSIDE_COLLISION_ZONE_POINT,
+            OUTSIDE_COLLISION_ZONE_POINT,
         )
     ],
 )
@@ -225,14 +224,100 @@ def test_is_valid_no_collision_zone(
     reference_point: HelperLatLon,
     sailbot_position: HelperLatLon,
     sailbot_speed: float,
-    invalid_point: XY,
-    valid_point: XY,
+    invalid_point: HelperLatLon,
+    valid_point: HelperLatLon,
 ):
     obstacle = Obstacle(reference_point, sailbot_position, sailbot_speed)
     with pytest.raises(ValueError):
-        obstacle.is_valid(invalid_point)
+        obstacle.is_valid(latlon_to_xy(reference_point, invalid_point))
     with pytest.raises(ValueError):
-        obstacle.is_valid(valid_point)
+        obstacle.is_valid(latlon_to_xy(reference_point, valid_point))
+    with pytest.raises(ValueError):
+        obstacle.is_valid_batch(np.zeros(1), np.zeros(1))
+
+    # Setting the collision zone directly skips the cached bounds and prepared geometry
+    obstacle.collision_zone = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    with pytest.raises(ValueError):
+        obstacle.is_valid(latlon_to_xy(reference_point, invalid_point))
+    with pytest.raises(ValueError):
+        obstacle.is_valid_batch(np.zeros(1), np.zeros(1))
+
+
+# Test is_valid agrees with the collision zone, both inside and outside its bounding box
+@pytest.mark.parametrize(
+    "reference_point,sailbot_position,sailbot_speed,collision_zone,offset,angle",
+    [
+        (
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
+            15.0,
+            Polygon([(0, 0), (1, 0), (1, 2), (0, 2)]),
+            XY(3.0, -1.0),
+            30.0,
+        )
+    ],
+)
+def test_is_valid_matches_collision_zone(
+    reference_point: HelperLatLon,
+    sailbot_position: HelperLatLon,
+    sailbot_speed: float,
+    collision_zone: Polygon,
+    offset: XY,
+    angle: float,
+):
+    obstacle = Obstacle(reference_point, sailbot_position, sailbot_speed)
+    obstacle.update_collision_zone(collision_zone, offset, angle)
+    buffered_collision_zone = obstacle.collision_zone
+    collision_zone_bounds = obstacle.collision_zone_bounds
+    assert buffered_collision_zone is not None and collision_zone_bounds is not None
+    assert collision_zone_bounds == buffered_collision_zone.bounds
+
+    min_x, min_y, max_x, max_y = collision_zone_bounds
+    for x in np.linspace(min_x - 1, max_x + 1, num=25):
+        for y in np.linspace(min_y - 1, max_y + 1, num=25):
+            assert obstacle.is_valid(XY(x, y)) != buffered_collision_zone.contains(
+                Point(x, y)
+            ), f"validity of ({x}, {y}) does not match the collision zone"
+
+
+# Test is_valid accepts shapely Points and is_valid_batch agrees with is_valid
+@pytest.mark.parametrize(
+    "reference_point,sailbot_position,ais_ship,sailbot_speed",
+    [
+        (
+            REFERENCE_POINT,
+            SAILBOT_POSITION,
+            HelperAISShip(
+                lat_lon=AIS_SHIP_POSITION,
+                cog=HelperHeading(heading=0.0),
+                sog=HelperSpeed(speed=20.0),
+                width=HelperDimension(dimension=20.0),
+                length=HelperDimension(dimension=100.0),
+                rot=HelperROT(rot=0),
+            ),
+            15.0,
+        )
+    ],
+)
+def test_is_valid_batch(
+    reference_point: HelperLatLon,
+    sailbot_position: HelperLatLon,
+    ais_ship: HelperAISShip,
+    sailbot_speed: float,
+):
+    boat1 = Boat(reference_point, sailbot_position, sailbot_speed, ais_ship)
+    assert boat1.collision_zone_bounds is not None
+    min_x, min_y, max_x, max_y = boat1.collision_zone_bounds
+    xs, ys = np.meshgrid(
+        np.linspace(min_x - 1, max_x + 1, num=25), np.linspace(min_y - 1, max_y + 1, num=25)
+    )
+
+    expected = np.array([boat1.is_valid(XY(x, y)) for x, y in zip(xs.ravel(), ys.ravel())])
+    assert not expected.all(), "some points should be within the collision zone"
+    assert np.array_equal(
+        [boat1.is_valid(Point(x, y)) for x, y in zip(xs.ravel(), ys.ravel())], expected
+    )
+    assert np.array_equal(boat1.is_valid_batch(xs, ys), expected.reshape(xs.shape))
 
 
 # Test updating Sailbot data
@@ -240,14 +325,14 @@ def test_is_valid_no_collision_zone(
     "ref_point,sailbot_position_1,sailbot_speed_1,sailbot_position_2,sailbot_speed_2,ais_ship",
     [
         (
-            HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
+            REFERENCE_POINT,
             HelperLatLon(latitude=51.9, longitude=-136.2),
             15.0,
             HelperLatLon(latitude=52.9, longitude=-137.2),
             20.0,
             HelperAISShip(
                 id=1,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -279,10 +364,10 @@ def test_update_sailbot_data(
         (
             HelperLatLon(latitude=52.2, longitude=-136.9),
             HelperLatLon(latitude=51.0, longitude=-136.0),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            SAILBOT_POSITION,
             HelperAISShip(
                 id=1,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -294,10 +379,10 @@ def test_update_sailbot_data(
         (
             HelperLatLon(latitude=50.06442134644842, longitude=-130.7725487868677),
             HelperLatLon(latitude=49.88670956993386, longitude=-130.37061359404225),
-            HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+            SAILBOT_POSITION,
             HelperAISShip(
                 id=1,
-                lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+                lat_lon=AIS_SHIP_POSITION,
                 cog=HelperHeading(heading=30.0),
                 sog=HelperSpeed(speed=20.0),
                 width=HelperDimension(dimension=20.0),
@@ -307,6 +392,7 @@ def test_update_sailbot_data(
             15.0,
         ),
     ],
+    ids=["large_reference_shift", "small_reference_shift"],
 )
 def test_update_reference_point(
     reference_point_1: HelperLatLon,
@@ -317,10 +403,7 @@ def test_update_reference_point(
 ):
     boat1 = Boat(reference_point_1, sailbot_position, sailbot_speed, ais_ship)
     if isinstance(boat1.collision_zone, Polygon):
-        point1 = Point(
-            boat1.collision_zone.exterior.coords.xy[0][0],
-            boat1.collision_zone.exterior.coords.xy[1][0],
-        )
+        point1 = Point(boat1.collision_zone.exterior.coords[0])
 
     assert boat1.reference == reference_point_1
     assert boat1.sailbot_position == pytest.approx(
@@ -329,10 +412,7 @@ def test_update_reference_point(
     # Change the reference point
     boat1.update_reference_point(reference_point_2)
     if isinstance(boat1.collision_zone, Polygon):
-        point2 = Point(
-            boat1.collision_zone.exterior.coords.xy[0][0],
-            boat1.collision_zone.exterior.coords.xy[1][0],
-        )
+        point2 = Point(boat1.collision_zone.exterior.coords[0])
 
     assert boat1.reference == reference_point_2
     assert boat1.sailbot_position_latlon == sailbot_position
@@ -341,8 +421,7 @@ def test_update_reference_point(
     )
 
     # Calculate the expected displacement based on the old and new reference point
-    x_displacement, y_displacement = latlon_to_xy(reference_point_2, reference_point_1)
-    displacement = np.sqrt(x_displacement**2 + y_displacement**2)
+    displacement = np.hypot(*latlon_to_xy(reference_point_2, reference_point_1))
     # calculate how far the collision zone was actually translated on reference point update
     translation = point1.distance(point2)
 
@@ -374,7 +453,7 @@ if __name__ == "__main__":
     # Sample AIS SHIP message
     ais_ship = HelperAISShip(
         id=1,
-        lat_lon=HelperLatLon(latitude=51.97917631092298, longitude=-137.1106454702385),
+        lat_lon=AIS_SHIP_POSITION,
         cog=HelperHeading(heading=0.0),
         sog=HelperSpeed(speed=18.52),
         width=HelperDimension(dimension=20.0),
@@ -384,15 +463,15 @@ if __name__ == "__main__":
 
     # Create a boat object
     boat1 = Boat(
-        HelperLatLon(latitude=52.268119490007756, longitude=-136.9133983613776),
-        HelperLatLon(latitude=51.95785651405779, longitude=-136.26282894969611),
+        REFERENCE_POINT,
+        SAILBOT_POSITION,
         30.0,
         ais_ship,
     )
 
     # Choose some states for visual inspection
     valid_state = HelperLatLon(latitude=50.42973337261916, longitude=-134.12018940923838)
-    invalid_state = HelperLatLon(latitude=52.174842845359755, longitude=-137.10372451905042)
+    invalid_state = INSIDE_COLLISION_ZONE_POINT
 
     # Extract coordinates for sailbot
     sailbot_x, sailbot_y = boat1.sailbot_position
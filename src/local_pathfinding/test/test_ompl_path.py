@@ -7,18 +7,6 @@ import local_pathfinding.coord_systems as cs
 import local_pathfinding.ompl_path as ompl_path
 from local_pathfinding.local_path import LocalPathState
 
-PATH = ompl_path.OMPLPath(
-    parent_logger=RcutilsLogger(),
-    max_runtime=1,
-    local_path_state=LocalPathState(
-        gps=GPS(),
-        ais_ships=AISShips(),
-        global_path=Path(),
-        filtered_wind_sensor=WindSensor(),
-        planner="rrtstar",
-    ),
-)
-
 
 def test_OMPLPathState():
     local_path_state = LocalPathState(
@@ -39,20 +27,20 @@ def test_OMPLPathState():
     ), "incorrect value for attribute goal_state"
 
 
-def test_OMPLPath___init__():
-    assert PATH.solved
+def test_OMPLPath___init__(default_ompl_path: ompl_path.OMPLPath):
+    assert default_ompl_path.solved
 
 
-def test_OMPLPath_get_cost():
+def test_OMPLPath_get_cost(default_ompl_path: ompl_path.OMPLPath):
     with pytest.raises(NotImplementedError):
-        PATH.get_cost()
+        default_ompl_path.get_cost()
 
 
-def test_OMPLPath_get_waypoint():
-    waypoints = PATH.get_waypoints()
+def test_OMPLPath_get_waypoint(default_ompl_path: ompl_path.OMPLPath):
+    waypoints = default_ompl_path.get_waypoints()
 
-    waypoint_XY = cs.XY(*PATH.state.start_state)
-    start_state_latlon = cs.xy_to_latlon(PATH.state.reference_latlon, waypoint_XY)
+    waypoint_XY = cs.XY(*default_ompl_path.state.start_state)
+    start_state_latlon = cs.xy_to_latlon(default_ompl_path.state.reference_latlon, waypoint_XY)
 
     test_start = waypoints[0]
     test_goal = waypoints[-1]
@@ -61,13 +49,17 @@ def test_OMPLPath_get_waypoint():
         (start_state_latlon.latitude, start_state_latlon.longitude), abs=1e-2
     ), "first waypoint should be start state"
     assert (test_goal.latitude, test_goal.longitude) == pytest.approx(
-        (PATH.state.reference_latlon.latitude, PATH.state.reference_latlon.longitude), abs=1e-2
+        (
+            default_ompl_path.state.reference_latlon.latitude,
+            default_ompl_path.state.reference_latlon.longitude,
+        ),
+        abs=1e-2,
     ), "last waypoint should be goal state"
 
 
-def test_OMPLPath_update_objectives():
+def test_OMPLPath_update_objectives(default_ompl_path: ompl_path.OMPLPath):
     with pytest.raises(NotImplementedError):
-        PATH.update_objectives()
+        default_ompl_path.update_objectives()
 
 
 @pytest.mark.parametrize(
@@ -77,8 +69,8 @@ def test_OMPLPath_update_objectives():
         (0.6, 0.6, False),
     ],
 )
-def test_is_state_valid(x: float, y: float, is_valid: bool):
-    state = pyompl.ScopedState(PATH._simple_setup.getStateSpace())
+def test_is_state_valid(x: float, y: float, is_valid: bool, default_ompl_path: ompl_path.OMPLPath):
+    state = pyompl.ScopedState(default_ompl_path._simple_setup.getStateSpace())
     state.setXY(x, y)
 
     if is_valid:
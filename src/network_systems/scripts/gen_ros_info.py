@@ -1,7 +1,11 @@
 import os
+from typing import Type
 
 import yaml
 
+# Prefer the libyaml based loader when PyYAML was built with it
+SAFE_LOADER: Type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 NET_DIR = os.path.join(
     os.getenv("ROS_WORKSPACE", default="/workspaces/sailbot_workspace"), "src/network_systems"
 )
@@ -29,34 +33,42 @@ GEN_PYTHON_FILE = os.path.join(NET_DIR, "launch/ros_info.py")
 GEN_PYTHON_PREAMBLE = f"# {GEN_FILE_WARN} # noqa: E501\n"
 
 
-def populate_hdr(hdr_file_obj, info_target):
-    for k, v in info_target.items():
-        hdr_file_obj.write(f'static constexpr auto {k} = "{v}";\n')
-
+def populate_hdr(info_target):
+    return "".join(f'static constexpr auto {k} = "{v}";\n' for k, v in info_target.items())
 
-def populate_py_nodes(py_file_obj, info_target):
-    for k, v in info_target.items():
-        py_file_obj.write(f'{k}_NODE = "{v}"\n')
 
+def populate_py_nodes(info_target):
+    return "".join(f'{k}_NODE = "{v}"\n' for k, v in info_target.items())
 
-def main():
-    with open(ROS_INFO_FILE, "r") as f:
-        info = yaml.safe_load(f)
 
-        with open(GEN_HDR_FILE, "w+") as out_hdr:
-            out_hdr.write(GEN_HDR_PREAMBLE)
+def write_if_changed(path, content):
+    # Leaving an unchanged file untouched preserves its modification time, so the build does not
+    # recompile everything that includes it
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            if f.read() == content:
+                return
+    with open(path, "w") as f:
+        f.write(content)
 
-            out_hdr.write(GEN_HDR_FILE_TOPICS_START)
-            populate_hdr(out_hdr, info["ros_topics"])
-            out_hdr.write(GEN_HDR_FILE_TOPICS_END)
 
-            out_hdr.write(GEN_HDR_FILE_NODES_START)
-            populate_hdr(out_hdr, info["ros_nodes"])
-            out_hdr.write(GEN_HDR_FILE_NODES_END)
-
-        with open(GEN_PYTHON_FILE, "w+") as out_py:
-            out_py.write(GEN_PYTHON_PREAMBLE)
-            populate_py_nodes(out_py, info["ros_nodes"])
+def main():
+    with open(ROS_INFO_FILE, "r") as f:
+        info = yaml.load(f, Loader=SAFE_LOADER)
+
+    hdr_content = (
+        GEN_HDR_PREAMBLE
+        + GEN_HDR_FILE_TOPICS_START
+        + populate_hdr(info["ros_topics"])
+        + GEN_HDR_FILE_TOPICS_END
+        + GEN_HDR_FILE_NODES_START
+        + populate_hdr(info["ros_nodes"])
+        + GEN_HDR_FILE_NODES_END
+    )
+    write_if_changed(GEN_HDR_FILE, hdr_content)
+
+    py_content = GEN_PYTHON_PREAMBLE + populate_py_nodes(info["ros_nodes"])
+    write_if_changed(GEN_PYTHON_FILE, py_content)
 
 
 if __name__ == "__main__":